@@ -2,6 +2,7 @@
 
 # SerpApi Configuration
 SERPAPI_KEY = ""
+USE_SERPAPI_SDK = False  # Search through the serpapi client instead of aiohttp
 
 # MongoDB Configuration
 MONGODB_URI = "mongodb://localhost:27017/"
@@ -12,6 +13,7 @@ DATABASE_NAME = "serpapi_monitor"
 # Monitoring Configuration
 INTERVAL_MINUTES = 60  # Check every 60 minutes
 RUN_IMMEDIATELY = True  # Run first check immediately when starting
+SERP_CACHE_TTL_MINUTES = 360  # Reuse search results for 6 hours (0 disables caching); cached cycles store no records
 
 # Keywords to monitor
 KEYWORDS = [
@@ -35,4 +37,4 @@ SEARCH_PARAMS = {
 }
 
 # Data Retention
-DELETE_OLD_RECORDS_DAYS = 90  # Delete records older than 90 days
+DELETE_OLD_RECORDS_DAYS = 90  # MongoDB expires records older than 90 days (TTL index); None keeps all records
@@ -12,12 +12,34 @@ Usage:
 """
 
 import sys
+import queue
 import signal
-from datetime import datetime
+import logging
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from monitor import MongoDBHandler, KeywordMonitor
 import config
 
 
+def setup_logging() -> QueueListener:
+    """
+    Print monitor logs to stdout from a background thread
+    
+    Monitor code only enqueues records, so logging never blocks a
+    monitoring cycle on console output. SimpleQueue is reentrant, so the
+    SIGINT handler can log while another record is being enqueued.
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    
+    logger = logging.getLogger("monitor")
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    
+    listener.start()
+    return listener
+
+
 def ranking_change_handler(change_info):
     """Handle ranking changes"""
     print(f"\n🔔 RANKING CHANGE DETECTED!")
@@ -38,18 +60,20 @@ def show_ranking_history(db: MongoDBHandler):
             print(f"\nKeyword: '{keyword}' | Domain: '{domain}'")
             print("-" * 80)
             
-            history = db.get_ranking_history(keyword, domain, limit=10)
-            
-            if not history:
-                print("  No data available")
-                continue
+            history = db.iter_ranking_history(keyword, domain, limit=10)
             
-            for i, record in enumerate(history, 1):
-                timestamp = record['timestamp'].strftime('%Y-%m-%d %H:%M:%S')
+            count = 0
+            for count, record in enumerate(history, 1):
+                # Stored in UTC, shown in local time like the rest of the output
+                local_time = record['timestamp'].replace(tzinfo=timezone.utc).astimezone()
+                timestamp = local_time.strftime('%Y-%m-%d %H:%M:%S')
                 if record['found']:
-                    print(f"  {i}. [{timestamp}] Position: {record['position']} | {record['link']}")
+                    print(f"  {count}. [{timestamp}] Position: {record['position']} | {record['link']}")
                 else:
-                    print(f"  {i}. [{timestamp}] Not found in results")
+                    print(f"  {count}. [{timestamp}] Not found in results")
+            
+            if not count:
+                print("  No data available")
     
     print("\n" + "="*80 + "\n")
 
@@ -66,7 +90,11 @@ def run_monitor():
     
     # Initialize MongoDB handler
     try:
-        db = MongoDBHandler(config.MONGODB_URI, config.DATABASE_NAME)
+        db = MongoDBHandler(
+            config.MONGODB_URI,
+            config.DATABASE_NAME,
+            retention_days=config.DELETE_OLD_RECORDS_DAYS
+        )
     except ConnectionError as e:
         print(f"❌ Failed to connect to MongoDB: {e}")
         print("\nPlease ensure MongoDB is running and the connection string is correct.")
@@ -77,7 +105,9 @@ def run_monitor():
     monitor = KeywordMonitor(
         api_key=config.SERPAPI_KEY,
         mongodb_handler=db,
-        interval_minutes=config.INTERVAL_MINUTES
+        interval_minutes=config.INTERVAL_MINUTES,
+        use_sdk=config.USE_SERPAPI_SDK,
+        cache_ttl_minutes=config.SERP_CACHE_TTL_MINUTES
     )
     
     # Configure monitoring
@@ -90,29 +120,32 @@ def run_monitor():
     # Register change handler
     monitor.on_change(ranking_change_handler)
     
-    # Handle Ctrl+C gracefully
+    # Handle Ctrl+C gracefully: stopping wakes the monitoring loop, and a
+    # second Ctrl+C interrupts a check that is still running
     def signal_handler(sig, frame):
         print("\n\nReceived interrupt signal. Stopping monitor...")
+        print("Press Ctrl+C again to exit immediately.")
+        signal.signal(signal.SIGINT, signal.default_int_handler)
         monitor.stop()
-        db.close()
-        print("Goodbye!")
-        sys.exit(0)
     
     signal.signal(signal.SIGINT, signal_handler)
     
-    # Start monitoring
+    # Start monitoring on the main thread until stopped
+    failed = False
     try:
-        monitor.start(run_immediately=config.RUN_IMMEDIATELY)
-        
-        # Keep main thread alive
         print("\nMonitor is running. Press Ctrl+C to stop.\n")
-        while True:
-            signal.pause()
+        monitor.start(run_immediately=config.RUN_IMMEDIATELY, block=True)
+    except KeyboardInterrupt:
+        print("\nCheck interrupted.")
     except Exception as e:
         print(f"❌ Error: {e}")
-        monitor.stop()
+        failed = True
+    finally:
         db.close()
+    
+    if failed:
         sys.exit(1)
+    print("Goodbye!")
 
 
 def run_once():
@@ -122,7 +155,11 @@ def run_once():
     print("="*80 + "\n")
     
     try:
-        db = MongoDBHandler(config.MONGODB_URI, config.DATABASE_NAME)
+        db = MongoDBHandler(
+            config.MONGODB_URI,
+            config.DATABASE_NAME,
+            retention_days=config.DELETE_OLD_RECORDS_DAYS
+        )
     except ConnectionError as e:
         print(f"❌ Failed to connect to MongoDB: {e}")
         sys.exit(1)
@@ -130,7 +167,9 @@ def run_once():
     monitor = KeywordMonitor(
         api_key=config.SERPAPI_KEY,
         mongodb_handler=db,
-        interval_minutes=config.INTERVAL_MINUTES
+        interval_minutes=config.INTERVAL_MINUTES,
+        use_sdk=config.USE_SERPAPI_SDK,
+        cache_ttl_minutes=config.SERP_CACHE_TTL_MINUTES
     )
     
     monitor.configure(
@@ -151,7 +190,11 @@ def main():
             run_once()
         elif sys.argv[1] == '--history':
             try:
-                db = MongoDBHandler(config.MONGODB_URI, config.DATABASE_NAME)
+                db = MongoDBHandler(
+                    config.MONGODB_URI,
+                    config.DATABASE_NAME,
+                    create_indexes=False
+                )
                 show_ranking_history(db)
                 db.close()
             except ConnectionError as e:
@@ -168,4 +211,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    listener = setup_logging()
+    try:
+        main()
+    finally:
+        listener.stop()
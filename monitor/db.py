@@ -2,57 +2,162 @@
 MongoDB handler for storing keyword ranking data
 """
 
-from datetime import datetime
-from typing import Dict, List, Optional
-from pymongo import MongoClient, DESCENDING
-from pymongo.errors import ConnectionFailure
+import logging
+import warnings
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from bson import ObjectId
+from pymongo import MongoClient, DESCENDING, InsertOne, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure
+
+
+logger = logging.getLogger(__name__)
+
+# Main compound index; position is part of the key so position-only
+# queries are answered from the index alone
+RANKING_INDEX = [
+    ("keyword", 1),
+    ("domain", 1),
+    ("timestamp", DESCENDING),
+    ("position", 1)
+]
+
+# Indexes created by earlier versions and superseded by the current ones
+LEGACY_INDEXES = ("keyword_1_domain_1_timestamp_-1", "timestamp_-1")
+
+# TTL index expiring records after the retention period
+TTL_INDEX = "timestamp_1"
+
+# Fields needed to display a ranking history entry
+HISTORY_FIELDS = {"timestamp": 1, "found": 1, "position": 1, "link": 1, "_id": 0}
+
+# Server error code for a unique index violation
+DUPLICATE_KEY_ERROR = 11000
+
+# Databases whose indexes were already created by this process
+_INDEXES_ENSURED: Set[str] = set()
 
 
 class MongoDBHandler:
     """Handle MongoDB operations for keyword monitoring"""
     
-    def __init__(self, connection_string: str, database_name: str = "serpapi_monitor"):
+    def __init__(
+        self,
+        connection_string: str,
+        database_name: str = "serpapi_monitor",
+        retention_days: Optional[int] = 90,
+        create_indexes: bool = True
+    ):
         """
         Initialize MongoDB connection
         
         Args:
             connection_string: MongoDB connection string
             database_name: Database name to use
+            retention_days: Number of days ranking records are kept before
+                MongoDB expires them, or None to keep them forever
+            create_indexes: Set up indexes and retention; disable for
+                read-only use
         """
+        if retention_days is not None and retention_days <= 0:
+            raise ValueError("retention_days must be a positive number of days or None")
+        
+        self.retention_days = retention_days
         try:
             self.client = MongoClient(connection_string)
             # Test connection
             self.client.admin.command('ping')
             self.db = self.client[database_name]
             self.collection = self.db['keyword_rankings']
-            self._create_indexes()
-            print(f"Successfully connected to MongoDB: {database_name}")
+            self.serp_cache = self.db['serp_cache']
+            if create_indexes:
+                self._create_indexes()
+            logger.info("Successfully connected to MongoDB: %s", database_name)
         except ConnectionFailure as e:
             raise ConnectionError(f"Failed to connect to MongoDB: {e}")
+        except OperationFailure as e:
+            raise ConnectionError(f"Failed to set up MongoDB database '{database_name}': {e}")
     
     def _create_indexes(self):
-        """Create indexes for better query performance"""
+        """Create indexes for better query performance, once per process"""
+        if self.db.name in _INDEXES_ENSURED:
+            return
+        
+        # Drop superseded indexes first: they only add write overhead, and the
+        # old compound index has the same key pattern as the partial index
+        # below, which servers before MongoDB 5.0 reject
+        existing = self.collection.index_information()
+        for name in LEGACY_INDEXES:
+            if name in existing:
+                self.collection.drop_index(name)
+        
         # Compound index for efficient querying
-        self.collection.create_index([
-            ("keyword", 1),
-            ("domain", 1),
-            ("timestamp", DESCENDING)
-        ])
-        self.collection.create_index([("timestamp", DESCENDING)])
+        self.collection.create_index(RANKING_INDEX)
+        # Partial index for history views restricted to found rankings
+        self.collection.create_index(
+            [
+                ("keyword", 1),
+                ("domain", 1),
+                ("timestamp", DESCENDING)
+            ],
+            name="keyword_1_domain_1_timestamp_-1_found",
+            partialFilterExpression={"found": True}
+        )
+        # One record per pair and monitoring cycle, so overlapping or
+        # restarted runs cannot store the same cycle twice
+        self.collection.create_index(
+            [
+                ("keyword", 1),
+                ("domain", 1),
+                ("cycle", 1)
+            ],
+            unique=True,
+            partialFilterExpression={"cycle": {"$exists": True}}
+        )
+        # TTL index: MongoDB removes records older than the retention period
+        if self.retention_days is None:
+            if TTL_INDEX in existing:
+                self.collection.drop_index(TTL_INDEX)
+        else:
+            expire_after = self.retention_days * 86400
+            try:
+                self.collection.create_index("timestamp", expireAfterSeconds=expire_after)
+            except OperationFailure:
+                # Index exists with a different retention period, update it in place
+                self.db.command(
+                    "collMod",
+                    self.collection.name,
+                    index={"keyPattern": {"timestamp": 1}, "expireAfterSeconds": expire_after}
+                )
+        # Cached search results are dropped once their expires_at has passed
+        self.serp_cache.create_index("expires_at", expireAfterSeconds=0)
+        
+        _INDEXES_ENSURED.add(self.db.name)
     
-    def save_ranking(self, keyword: str, domain: str, ranking_data: Dict):
+    def build_ranking_document(
+        self,
+        keyword: str,
+        domain: str,
+        ranking_data: Dict,
+        cycle: Optional[datetime] = None
+    ) -> Dict:
         """
-        Save keyword ranking data to MongoDB
+        Build the document stored for a keyword ranking check
         
         Args:
             keyword: Search keyword
             domain: Domain name
             ranking_data: Dictionary containing ranking information
+            cycle: Start of the scheduled monitoring cycle (UTC); a pair is
+                stored at most once per cycle
+            
+        Returns:
+            Document ready to be inserted; the timestamp is set when the
+            document is saved
         """
         document = {
             "keyword": keyword,
             "domain": domain,
-            "timestamp": datetime.now(),
             "position": ranking_data.get("position"),
             "link": ranking_data.get("link"),
             "title": ranking_data.get("title"),
@@ -61,12 +166,87 @@ class MongoDBHandler:
             "total_results": ranking_data.get("total_results"),
             "search_params": ranking_data.get("search_params", {})
         }
+        if cycle is not None:
+            document["cycle"] = cycle
+        return document
+    
+    def save_ranking(self, keyword: str, domain: str, ranking_data: Dict):
+        """
+        Save keyword ranking data to MongoDB
         
-        result = self.collection.insert_one(document)
-        print(f"Saved record for '{keyword}' + '{domain}': {result.inserted_id}")
-        return result.inserted_id
+        Args:
+            keyword: Search keyword
+            domain: Domain name
+            ranking_data: Dictionary containing ranking information
+        """
+        document = self.build_ranking_document(keyword, domain, ranking_data)
+        
+        inserted_id = self.save_rankings_bulk([document])[0]
+        logger.info("Saved record for '%s' + '%s': %s", keyword, domain, inserted_id)
+        return inserted_id
+    
+    def save_rankings_bulk(self, documents: List[Dict]) -> List:
+        """
+        Save multiple ranking documents in a single round-trip
+        
+        Documents with a cycle are upserted on (keyword, domain, cycle), so
+        saving the same cycle again is a no-op and retries are safe. Other
+        documents are always inserted.
+        
+        Args:
+            documents: Documents built with build_ranking_document
+            
+        Returns:
+            The inserted id of each document, or None where the pair was
+            already stored for the cycle
+        """
+        if not documents:
+            return []
+        
+        timestamp = datetime.utcnow()
+        operations = []
+        inserted = {}
+        for i, document in enumerate(documents):
+            if "cycle" in document:
+                key = {k: document[k] for k in ("keyword", "domain", "cycle")}
+                operations.append(UpdateOne(
+                    key,
+                    {"$setOnInsert": {"timestamp": timestamp, **document}},
+                    upsert=True
+                ))
+            else:
+                record = {"_id": ObjectId(), "timestamp": timestamp, **document}
+                inserted[i] = record["_id"]
+                operations.append(InsertOne(record))
+        
+        # Unordered writes let the server continue past individual failures
+        try:
+            result = self.collection.bulk_write(operations, ordered=False)
+            upserted = result.upserted_ids
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != DUPLICATE_KEY_ERROR for error in errors):
+                raise
+            # Concurrent runs raced on the unique index; their record is kept
+            logger.warning("Skipped %d duplicate records", len(errors))
+            upserted = {item["index"]: item["_id"] for item in e.details.get("upserted", [])}
+        
+        # Plain inserts cannot be duplicates; their ids were assigned above
+        upserted.update(inserted)
+        
+        duplicates = len(documents) - len(upserted)
+        if duplicates:
+            logger.info("%d records were already stored for this cycle", duplicates)
+        
+        return [upserted.get(i) for i in range(len(documents))]
     
-    def get_ranking_history(self, keyword: str, domain: str, limit: int = 100) -> List[Dict]:
+    def get_ranking_history(
+        self,
+        keyword: str,
+        domain: str,
+        limit: int = 100,
+        found_only: bool = False
+    ) -> List[Dict]:
         """
         Get ranking history for a keyword and domain
         
@@ -74,15 +254,92 @@ class MongoDBHandler:
             keyword: Search keyword
             domain: Domain name
             limit: Maximum number of records to return
+            found_only: Only return records where the domain was found
             
         Returns:
             List of ranking records
         """
-        cursor = self.collection.find(
-            {"keyword": keyword, "domain": domain}
-        ).sort("timestamp", DESCENDING).limit(limit)
+        return list(self._find_history(keyword, domain, limit, found_only))
+    
+    def iter_ranking_history(
+        self,
+        keyword: str,
+        domain: str,
+        limit: int = 100,
+        found_only: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Stream ranking history for a keyword and domain
         
-        return list(cursor)
+        Only the fields in HISTORY_FIELDS are fetched and records are read
+        from the server in batches, so memory use does not grow with limit.
+        
+        Args:
+            keyword: Search keyword
+            domain: Domain name
+            limit: Maximum number of records to return
+            found_only: Only return records where the domain was found
+            
+        Yields:
+            Ranking records, newest first
+        """
+        yield from self._find_history(keyword, domain, limit, found_only, HISTORY_FIELDS)
+    
+    def _find_history(
+        self,
+        keyword: str,
+        domain: str,
+        limit: int,
+        found_only: bool,
+        projection: Optional[Dict] = None
+    ):
+        """Build the cursor for a ranking history query"""
+        query = {"keyword": keyword, "domain": domain}
+        if found_only:
+            query["found"] = True
+        
+        return self.collection.find(
+            query,
+            projection=projection
+        ).sort("timestamp", DESCENDING).limit(limit).batch_size(min(limit, 100))
+    
+    def get_latest_states(
+        self,
+        keywords: List[str],
+        domains: List[str]
+    ) -> Dict[Tuple[str, str], Dict]:
+        """
+        Get the latest stored state of keyword and domain pairs
+        
+        Each pair is one indexed lookup that reads a single record, so the
+        cost does not grow with the amount of stored history.
+        
+        Args:
+            keywords: Keywords to include
+            domains: Domains to include
+            
+        Returns:
+            Dictionary mapping (keyword, domain) to the latest position,
+            found flag, total_results and timestamp of pairs with records
+        """
+        states = {}
+        for keyword in keywords:
+            for domain in domains:
+                record = self.collection.find_one(
+                    {"keyword": keyword, "domain": domain},
+                    projection={
+                        "position": 1,
+                        "found": 1,
+                        "total_results": 1,
+                        "timestamp": 1,
+                        "_id": 0
+                    },
+                    sort=[("timestamp", DESCENDING)]
+                )
+                if record is not None:
+                    states[(keyword, domain)] = record
+        
+        return states
     
     def get_latest_ranking(self, keyword: str, domain: str) -> Optional[Dict]:
         """
@@ -112,8 +369,7 @@ class MongoDBHandler:
         Returns:
             List of ranking records within the time period
         """
-        from datetime import timedelta
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
         
         cursor = self.collection.find({
             "keyword": keyword,
@@ -125,28 +381,92 @@ class MongoDBHandler:
     
     def get_all_keywords(self) -> List[str]:
         """Get all unique keywords in the database"""
-        return self.collection.distinct("keyword")
+        return self._distinct_values("keyword")
     
     def get_all_domains(self) -> List[str]:
         """Get all unique domains in the database"""
-        return self.collection.distinct("domain")
+        return self._distinct_values("domain")
+    
+    def _distinct_values(self, field: str) -> List[str]:
+        """
+        Get the unique values of a field using the compound index
+        
+        Unlike distinct(), the aggregation is not limited to a 16MB result
+        and is answered from the index without reading documents.
+        
+        Args:
+            field: Field name
+            
+        Returns:
+            List of unique values
+        """
+        cursor = self.collection.aggregate(
+            [{"$group": {"_id": f"${field}"}}],
+            hint=RANKING_INDEX,
+            allowDiskUse=False
+        )
+        return [doc["_id"] for doc in cursor]
     
     def delete_old_records(self, days: int = 90):
         """
         Delete records older than specified days
         
+        Deprecated: records are expired automatically by the TTL index on
+        ``timestamp``; configure the period with ``retention_days`` instead.
+        
         Args:
             days: Number of days to keep
         """
-        from datetime import timedelta
-        cutoff_time = datetime.now() - timedelta(days=days)
+        warnings.warn(
+            "delete_old_records is deprecated, old records are expired by the "
+            "TTL index configured through retention_days",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        cutoff_time = datetime.utcnow() - timedelta(days=days)
         
         result = self.collection.delete_many({"timestamp": {"$lt": cutoff_time}})
-        print(f"Deleted {result.deleted_count} old records")
+        logger.info("Deleted %d old records", result.deleted_count)
         return result.deleted_count
     
+    def get_cached_serps(self, keys: List[str]) -> Dict[str, Tuple[datetime, Dict]]:
+        """
+        Get cached search results
+        
+        Args:
+            keys: Cache keys to look up
+            
+        Returns:
+            Dictionary mapping each cached key to (cached_at, results)
+        """
+        cursor = self.serp_cache.find({"_id": {"$in": keys}})
+        return {doc["_id"]: (doc["cached_at"], doc["results"]) for doc in cursor}
+    
+    def save_cached_serps(self, entries: Dict[str, Dict], expire_after_seconds: int):
+        """
+        Cache search results, replacing older entries for the same keys
+        
+        Args:
+            entries: Dictionary mapping cache keys to search results
+            expire_after_seconds: How long MongoDB keeps the entries
+        """
+        if not entries:
+            return
+        
+        cached_at = datetime.utcnow()
+        expires_at = cached_at + timedelta(seconds=expire_after_seconds)
+        operations = [
+            ReplaceOne(
+                {"_id": key},
+                {"results": results, "cached_at": cached_at, "expires_at": expires_at},
+                upsert=True
+            )
+            for key, results in entries.items()
+        ]
+        self.serp_cache.bulk_write(operations, ordered=False)
+    
     def close(self):
         """Close MongoDB connection"""
         if self.client:
             self.client.close()
-            print("MongoDB connection closed")
+            logger.info("MongoDB connection closed")
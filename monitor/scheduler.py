@@ -2,13 +2,40 @@
 Keyword monitoring scheduler with periodic checks
 """
 
+import asyncio
+import hashlib
+import json
+import logging
+import re
 import time
-from datetime import datetime
-from typing import List, Dict, Callable, Optional
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Callable, FrozenSet, Optional, Set, Tuple
 from threading import Thread, Event
-from serpapi import GoogleSearch
+from urllib.parse import urlparse
+import aiohttp
 from .db import MongoDBHandler
 
+try:
+    from serpapi import GoogleSearch
+except ImportError:
+    GoogleSearch = None
+
+try:
+    # Faster parsing of large SerpApi responses when available
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+logger = logging.getLogger(__name__)
+
+SERPAPI_ENDPOINT = "https://serpapi.com/search.json"
+MAX_CONCURRENT_SEARCHES = 5  # Upper bound on in-flight SerpApi requests
+STOP_POLL_SECONDS = 1.0  # Longest uninterrupted wait of the monitoring loop
+HEARTBEAT_HOURS = 24  # Maximum gap between stored records of an unchanged pair
+TEMPORAL_CACHE_TTL_MINUTES = 5  # Cache lifetime for time-sensitive keywords
+TEMPORAL_KEYWORD_RE = re.compile(r"\b(today|news|latest|now|20\d\d)\b", re.IGNORECASE)
+
 
 class KeywordMonitor:
     """Monitor keyword rankings on a schedule"""
@@ -17,7 +44,9 @@ class KeywordMonitor:
         self,
         api_key: str,
         mongodb_handler: MongoDBHandler,
-        interval_minutes: int = 60
+        interval_minutes: int = 60,
+        use_sdk: bool = False,
+        cache_ttl_minutes: int = 360
     ):
         """
         Initialize keyword monitor
@@ -26,17 +55,38 @@ class KeywordMonitor:
             api_key: SerpApi API key
             mongodb_handler: MongoDB handler instance
             interval_minutes: Monitoring interval in minutes
+            use_sdk: If True, search through the serpapi GoogleSearch client
+                instead of aiohttp
+            cache_ttl_minutes: How long search results are reused before
+                searching again (0 disables caching); cycles served from the
+                cache store no new records
         """
+        if use_sdk and GoogleSearch is None:
+            raise ImportError("use_sdk requires the google-search-results package")
+        if interval_minutes <= 0:
+            raise ValueError("interval_minutes must be positive")
+        
         self.api_key = api_key
         self.db = mongodb_handler
         self.interval_minutes = interval_minutes
+        self.use_sdk = use_sdk
+        self.cache_ttl_minutes = cache_ttl_minutes
         self.keywords = []
         self.domains = []
+        self._domains_set: FrozenSet[str] = frozenset()
         self.search_params = {}
+        self._base_params = {}
         self.running = False
         self.thread = None
         self.stop_event = Event()
+        self._cycle_anchor: Optional[datetime] = None
         self.on_change_callback: Optional[Callable] = None
+        self._last_position: Dict[Tuple[str, str], Optional[int]] = {}
+        self._last_state: Dict[Tuple[str, str], Tuple[bool, Optional[int], Optional[int]]] = {}
+        self._last_saved: Dict[Tuple[str, str], float] = {}
+        self._states_loaded = False
+        self._serp_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._serp_cache_checked: Set[str] = set()
     
     def configure(
         self,
@@ -54,6 +104,7 @@ class KeywordMonitor:
         """
         self.keywords = keywords
         self.domains = domains
+        self._domains_set = frozenset(self._normalize_host(domain) for domain in domains)
         
         # Default search parameters
         self.search_params = {
@@ -65,32 +116,179 @@ class KeywordMonitor:
             **search_params
         }
         
-        print(f"Configured monitor: {len(keywords)} keywords, {len(domains)} domains")
-        print(f"Interval: {self.interval_minutes} minutes")
+        # Request parameters shared by every search; only "q" varies. The HTTP
+        # client only accepts str/int/float values, so booleans are spelled
+        # out and unset parameters are dropped
+        self._base_params = {
+            name: ("true" if value else "false") if isinstance(value, bool) else value
+            for name, value in {"api_key": self.api_key, **self.search_params}.items()
+            if value is not None
+        }
+        
+        logger.info("Configured monitor: %d keywords, %d domains", len(keywords), len(domains))
+        logger.info("Interval: %s minutes", self.interval_minutes)
     
-    def search_keyword(self, keyword: str) -> Dict:
+    async def _fetch(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        keyword: str
+    ) -> Dict:
         """
-        Search for a keyword using SerpApi
+        Fetch search results for a keyword from the SerpApi endpoint
         
         Args:
+            session: Shared aiohttp session
+            semaphore: Semaphore limiting concurrent requests
             keyword: Search keyword
             
         Returns:
-            Search results dictionary
+            Search results dictionary (empty on error)
         """
-        params = {
-            "api_key": self.api_key,
-            "q": keyword,
-            **self.search_params
-        }
+        params = {"q": keyword, **self._base_params}
+        
+        async with semaphore:
+            try:
+                if self.use_sdk:
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(
+                        None, lambda: GoogleSearch(params).get_dict()
+                    )
+                
+                async with session.get(SERPAPI_ENDPOINT, params=params) as response:
+                    return json_loads(await response.read())
+            except Exception as e:
+                logger.error("Error searching for '%s': %s", keyword, e)
+                return {}
+    
+    async def _search_all(self, keywords: List[str]) -> Tuple[Dict[str, Dict], Set[str]]:
+        """
+        Search all keywords concurrently, one request per unique keyword
+        
+        Args:
+            keywords: Keywords to search
+            
+        Returns:
+            Tuple of a dictionary mapping each keyword to its search results
+            and the set of keywords answered from the cache
+        """
+        unique_keywords = list(dict.fromkeys(keywords))
+        search_results = self._get_cached_results(unique_keywords)
+        cached = set(search_results)
+        missing = [keyword for keyword in unique_keywords if keyword not in search_results]
+        
+        if search_results:
+            logger.info("Using cached results for %d keywords", len(search_results))
+        
+        if missing:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+            connector = aiohttp.TCPConnector(limit=10)
+            timeout = aiohttp.ClientTimeout(total=60)
+            
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                tasks = [self._fetch(session, semaphore, keyword) for keyword in missing]
+                responses = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            fetched = {
+                keyword: response if isinstance(response, dict) else {}
+                for keyword, response in zip(missing, responses)
+            }
+            self._cache_results(fetched)
+            search_results.update(fetched)
+        
+        return {keyword: search_results[keyword] for keyword in unique_keywords}, cached
+    
+    def _cache_key(self, keyword: str) -> str:
+        """Build the cache key for a keyword and the current search parameters"""
+        params = json.dumps({"q": keyword, **self.search_params}, sort_keys=True)
+        return hashlib.sha1(params.encode("utf-8")).hexdigest()
+    
+    def _cache_ttl(self, keyword: str) -> int:
+        """Get how many seconds cached results for a keyword stay fresh"""
+        ttl_minutes = self.cache_ttl_minutes
+        if TEMPORAL_KEYWORD_RE.search(keyword):
+            ttl_minutes = min(ttl_minutes, TEMPORAL_CACHE_TTL_MINUTES)
+        return ttl_minutes * 60
+    
+    def _get_cached_results(self, keywords: List[str]) -> Dict[str, Dict]:
+        """
+        Get still fresh cached search results
+        
+        Keys not looked up yet are loaded from the cache persisted in
+        MongoDB so restarts do not start cold. The cache is best-effort:
+        MongoDB errors are logged and treated as misses.
+        
+        Args:
+            keywords: Keywords to look up
+            
+        Returns:
+            Dictionary mapping cached keywords to their search results
+        """
+        if self.cache_ttl_minutes <= 0:
+            return {}
+        
+        keys = {keyword: self._cache_key(keyword) for keyword in keywords}
+        
+        unchecked = [key for key in keys.values() if key not in self._serp_cache_checked]
+        if unchecked:
+            try:
+                persisted = self.db.get_cached_serps(unchecked)
+            except Exception as e:
+                logger.error("Error loading cached search results: %s", e)
+            else:
+                self._serp_cache_checked.update(unchecked)
+                for key, (cached_at, results) in persisted.items():
+                    cached_ts = cached_at.replace(tzinfo=timezone.utc).timestamp()
+                    if key not in self._serp_cache or self._serp_cache[key][0] < cached_ts:
+                        self._serp_cache[key] = (cached_ts, results)
+        
+        now = time.time()
+        cached = {}
+        for keyword, key in keys.items():
+            entry = self._serp_cache.get(key)
+            if entry and now - entry[0] < self._cache_ttl(keyword):
+                cached[keyword] = entry[1]
+        return cached
+    
+    def _cache_results(self, search_results: Dict[str, Dict]):
+        """
+        Cache successful search results in memory and in MongoDB
+        
+        Args:
+            search_results: Dictionary mapping keywords to search results
+        """
+        if self.cache_ttl_minutes <= 0:
+            return
         
+        now = time.time()
+        entries = {}
+        for keyword, results in search_results.items():
+            if not results or 'error' in results:
+                continue
+            key = self._cache_key(keyword)
+            self._serp_cache[key] = (now, results)
+            self._serp_cache_checked.add(key)
+            entries[key] = results
+        
+        # Results were already fetched; failing to persist them must not
+        # fail the cycle
         try:
-            search = GoogleSearch(params)
-            results = search.get_dict()
-            return results
+            self.db.save_cached_serps(entries, self.cache_ttl_minutes * 60)
         except Exception as e:
-            print(f"Error searching for '{keyword}': {e}")
-            return {}
+            logger.error("Error saving cached search results: %s", e)
+    
+    def search_keyword(self, keyword: str) -> Dict:
+        """
+        Search for a keyword using SerpApi
+        
+        Args:
+            keyword: Search keyword
+            
+        Returns:
+            Search results dictionary
+        """
+        search_results, _ = asyncio.run(self._search_all([keyword]))
+        return search_results[keyword]
     
     def check_domain_ranking(self, keyword: str, domain: str) -> Dict:
         """
@@ -103,69 +301,268 @@ class KeywordMonitor:
         Returns:
             Ranking data dictionary
         """
-        print(f"Checking: '{keyword}' for domain '{domain}'")
+        logger.info("Checking: '%s' for domain '%s'", keyword, domain)
         
         results = self.search_keyword(keyword)
+        ranking_data = self._extract_ranking(results, domain)
+        self._report_ranking(domain, ranking_data)
+        return ranking_data
+    
+    @staticmethod
+    def _normalize_host(host: str) -> str:
+        """Lowercase a host name and drop a leading 'www.'"""
+        host = host.lower()
+        return host[4:] if host.startswith('www.') else host
+    
+    def _index_results(
+        self,
+        results: Dict,
+        domains: Optional[FrozenSet[str]] = None
+    ) -> Dict[str, Dict]:
+        """
+        Index organic results by the tracked domain they belong to
         
-        if not results or 'organic_results' not in results:
+        A result belongs to a domain when its host is the domain or one of
+        its subdomains.
+        
+        Args:
+            results: Search results dictionary
+            domains: Normalized domains to index (defaults to the configured ones)
+            
+        Returns:
+            Dictionary mapping each matched domain to its best ranked result
+        """
+        if domains is None:
+            domains = self._domains_set
+        
+        index = {}
+        for result in results.get('organic_results', []):
+            try:
+                host = urlparse(result.get('link', '')).hostname
+            except ValueError:
+                # Malformed link, e.g. an unterminated IPv6 host
+                continue
+            if not host:
+                continue
+            
+            labels = self._normalize_host(host).split('.')
+            for i in range(len(labels)):
+                candidate = '.'.join(labels[i:])
+                if candidate in domains:
+                    index.setdefault(candidate, result)
+        return index
+    
+    def _extract_ranking(
+        self,
+        results: Dict,
+        domain: str,
+        index: Optional[Dict[str, Dict]] = None
+    ) -> Dict:
+        """
+        Extract the ranking of a domain from already fetched search results
+        
+        A result matches when its host is the domain or one of its subdomains.
+        
+        Args:
+            results: Search results dictionary
+            domain: Domain to look for
+            index: Domain index built by _index_results, reused across domains
+            
+        Returns:
+            Ranking data dictionary
+        """
+        domain = self._normalize_host(domain)
+        if index is None:
+            index = self._index_results(results, frozenset([domain]))
+        
+        total_results = results.get('search_information', {}).get('total_results')
+        result = index.get(domain)
+        
+        if result is not None:
             return {
-                "found": False,
-                "position": None,
-                "link": None,
-                "title": None,
-                "snippet": None,
-                "total_results": results.get('search_information', {}).get('total_results'),
+                "found": True,
+                "position": result.get('position'),
+                "link": result.get('link'),
+                "title": result.get('title'),
+                "snippet": result.get('snippet'),
+                "total_results": total_results,
                 "search_params": self.search_params
             }
         
-        # Search for domain in organic results
-        for result in results['organic_results']:
-            if 'link' in result and domain in result['link']:
-                ranking_data = {
-                    "found": True,
-                    "position": result.get('position'),
-                    "link": result.get('link'),
-                    "title": result.get('title'),
-                    "snippet": result.get('snippet'),
-                    "total_results": results.get('search_information', {}).get('total_results'),
-                    "search_params": self.search_params
-                }
-                print(f"  ✓ Found at position {result.get('position')}: {result.get('link')}")
-                return ranking_data
-        
-        print(f"  ✗ Domain '{domain}' not found in results")
         return {
             "found": False,
             "position": None,
             "link": None,
             "title": None,
             "snippet": None,
-            "total_results": results.get('search_information', {}).get('total_results'),
+            "total_results": total_results,
             "search_params": self.search_params
         }
     
-    def check_all(self):
-        """Check all configured keyword-domain combinations"""
-        print(f"\n{'='*60}")
-        print(f"Starting monitoring cycle at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*60}")
+    def _report_ranking(self, domain: str, ranking_data: Dict):
+        """Log the outcome of a ranking check"""
+        if ranking_data['found']:
+            logger.info("  Found at position %s: %s", ranking_data['position'], ranking_data['link'])
+        else:
+            logger.info("  Domain '%s' not found in results", domain)
+    
+    def check_all(self, cycle: Optional[datetime] = None):
+        """
+        Check all configured keyword-domain combinations
+        
+        Every keyword is fetched concurrently, then each domain is checked
+        locally against the shared results.
+        
+        Args:
+            cycle: Scheduled monitoring cycle the check belongs to; a retry
+                of the same cycle is not stored twice. Checks without a
+                cycle are always stored.
+        """
+        logger.info("Starting monitoring cycle at %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        
+        # One request per keyword, shared by all domains; only the searches
+        # run on the event loop, so MongoDB calls and the change callback
+        # are free to block or start their own loop
+        search_results, cached = asyncio.run(self._search_all(self.keywords))
+        
+        # Seed previous rankings from MongoDB on the first cycle
+        if not self._states_loaded:
+            self._load_last_states()
+        
+        checked = []
+        pending = []
+        now = time.time()
         
         for keyword in self.keywords:
+            if keyword in cached:
+                # Cached results were already checked when they were fetched;
+                # storing them again would record an observation that never
+                # happened
+                logger.info("Skipping '%s': results are cached from an earlier search", keyword)
+                continue
+            
+            results = search_results[keyword]
+            index = self._index_results(results)
+            
             for domain in self.domains:
-                ranking_data = self.check_domain_ranking(keyword, domain)
-                
-                # Save to MongoDB
-                self.db.save_ranking(keyword, domain, ranking_data)
+                logger.info("Checking: '%s' for domain '%s'", keyword, domain)
+                ranking_data = self._extract_ranking(results, domain, index)
+                self._report_ranking(domain, ranking_data)
                 
-                # Check for changes
-                self._check_changes(keyword, domain, ranking_data)
-                
-                # Small delay to avoid rate limiting
-                time.sleep(1)
+                state = self._ranking_state(ranking_data)
+                save = self._should_save((keyword, domain), state, now)
+                checked.append((keyword, domain, ranking_data, state, save))
+                if save:
+                    pending.append(
+                        self.db.build_ranking_document(keyword, domain, ranking_data, cycle)
+                    )
+        
+        # Save the whole cycle to MongoDB at once
+        inserted_ids = self.db.save_rankings_bulk(pending)
+        logger.info(
+            "Saved %d records, skipped %d unchanged",
+            sum(1 for inserted_id in inserted_ids if inserted_id is not None),
+            len(checked) - len(pending)
+        )
         
-        print(f"{'='*60}")
-        print(f"Monitoring cycle completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*60}\n")
+        # Only a successful write moves the in-memory state on, so a failed
+        # cycle does not suppress the same result next time
+        saved_ids = iter(inserted_ids)
+        for keyword, domain, ranking_data, state, save in checked:
+            key = (keyword, domain)
+            if save:
+                if next(saved_ids) is None:
+                    # Another run already stored and reported this cycle
+                    continue
+                self._last_saved[key] = now
+            self._last_state[key] = state
+            
+            # Check for changes
+            self._check_changes(keyword, domain, ranking_data)
+        
+        logger.info("Monitoring cycle completed at %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    
+    def _slot_seconds(self) -> int:
+        """Get the length of a monitoring cycle slot in whole seconds"""
+        return max(1, int(self.interval_minutes * 60))
+    
+    def _current_cycle(self, now: float) -> datetime:
+        """
+        Get the start of the monitoring cycle a point in time belongs to
+        
+        Cycles are interval-long UTC slots; start() anchors the scheduled
+        ticks to the slot it is called in.
+        
+        Args:
+            now: Time as returned by time.time()
+            
+        Returns:
+            Cycle start as a naive UTC datetime
+        """
+        slot = self._slot_seconds()
+        start = int(now) - int(now) % slot
+        return datetime.fromtimestamp(start, timezone.utc).replace(tzinfo=None)
+    
+    def _tick_cycle(self, tick: int) -> datetime:
+        """
+        Get the cycle of a scheduled tick
+        
+        Ticks count intervals from the slot the monitor started in, so every
+        scheduled check gets its own cycle however long the checks take.
+        
+        Args:
+            tick: Number of intervals since start() (0 for the initial check)
+            
+        Returns:
+            Cycle start as a naive UTC datetime
+        """
+        return self._cycle_anchor + timedelta(seconds=tick * self._slot_seconds())
+    
+    def _load_last_states(self):
+        """Load the latest stored ranking of every configured keyword and domain pair"""
+        states = self.db.get_latest_states(self.keywords, self.domains)
+        for key, state in states.items():
+            self._last_position[key] = state.get('position')
+            self._last_state[key] = self._ranking_state(state)
+            self._last_saved[key] = state['timestamp'].replace(tzinfo=timezone.utc).timestamp()
+        
+        self._states_loaded = True
+    
+    @staticmethod
+    def _ranking_state(ranking_data: Dict) -> Tuple[bool, Optional[int], Optional[int]]:
+        """Get the (found, position, total_results) state of a ranking"""
+        return (
+            ranking_data.get('found', False),
+            ranking_data.get('position'),
+            ranking_data.get('total_results')
+        )
+    
+    def _should_save(
+        self,
+        key: Tuple[str, str],
+        state: Tuple[bool, Optional[int], Optional[int]],
+        now: float
+    ) -> bool:
+        """
+        Decide whether the current state of a pair should be stored
+        
+        A "not found" result identical to the previous one carries no new
+        information and is skipped, except for one heartbeat record every
+        HEARTBEAT_HOURS so gaps in monitoring stay detectable.
+        
+        Args:
+            key: (keyword, domain) pair
+            state: Current state as returned by _ranking_state
+            now: Current time as returned by time.time()
+            
+        Returns:
+            True if the ranking should be saved
+        """
+        return not (
+            not state[0]
+            and state == self._last_state.get(key)
+            and now - self._last_saved.get(key, 0) < HEARTBEAT_HOURS * 3600
+        )
     
     def _check_changes(self, keyword: str, domain: str, current_data: Dict):
         """
@@ -176,12 +573,11 @@ class KeywordMonitor:
             domain: Domain name
             current_data: Current ranking data
         """
-        history = self.db.get_ranking_history(keyword, domain, limit=2)
+        key = (keyword, domain)
+        current_pos = current_data.get('position')
         
-        if len(history) >= 2:
-            previous = history[1]  # Second latest (first is the one just inserted)
-            current_pos = current_data.get('position')
-            previous_pos = previous.get('position')
+        if key in self._last_position:
+            previous_pos = self._last_position[key]
             
             if current_pos != previous_pos:
                 change_info = {
@@ -191,10 +587,12 @@ class KeywordMonitor:
                     "current_position": current_pos,
                     "timestamp": datetime.now()
                 }
-                print(f"  📊 Ranking changed: {previous_pos} → {current_pos}")
+                logger.info("  Ranking changed: %s -> %s", previous_pos, current_pos)
                 
                 if self.on_change_callback:
                     self.on_change_callback(change_info)
+        
+        self._last_position[key] = current_pos
     
     def on_change(self, callback: Callable):
         """
@@ -205,57 +603,107 @@ class KeywordMonitor:
         """
         self.on_change_callback = callback
     
-    def _monitor_loop(self):
-        """Internal monitoring loop"""
-        while not self.stop_event.is_set():
+    def _wait_until(self, deadline: float) -> bool:
+        """
+        Wait until a time.monotonic() deadline or until stop() is called
+        
+        The wait is split into short slices because, before Python 3.14,
+        Ctrl+C cannot interrupt a lock wait on Windows.
+        
+        Args:
+            deadline: time.monotonic() value to wait for
+            
+        Returns:
+            True if monitoring was stopped
+        """
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return self.stop_event.is_set()
+            if self.stop_event.wait(min(remaining, STOP_POLL_SECONDS)):
+                return True
+    
+    def _monitor_loop(self, start: float):
+        """
+        Internal monitoring loop
+        
+        Args:
+            start: time.monotonic() value at which monitoring started
+        """
+        interval = self.interval_minutes * 60
+        tick = 1
+        
+        # Wait for next tick or stop event; ticks sit at fixed offsets from
+        # start so the duration of a check does not shift the schedule
+        while not self._wait_until(start + tick * interval):
             try:
-                self.check_all()
+                self.check_all(self._tick_cycle(tick))
             except Exception as e:
-                print(f"Error in monitoring loop: {e}")
+                logger.error("Error in monitoring loop: %s", e)
             
-            # Wait for next interval or stop event
-            self.stop_event.wait(self.interval_minutes * 60)
+            # A check that overran the interval is followed immediately by the
+            # tick that is due now, without trying to catch up on missed ones
+            tick = max(tick + 1, int((time.monotonic() - start) // interval))
     
-    def start(self, run_immediately: bool = True):
+    def start(self, run_immediately: bool = True, block: bool = False):
         """
-        Start monitoring in background thread
+        Start monitoring
         
         Args:
             run_immediately: If True, run first check immediately
+            block: If True, run the monitoring loop on the calling thread until
+                stop() is called instead of in a background thread
         """
         if self.running:
-            print("Monitor is already running")
+            logger.warning("Monitor is already running")
             return
         
         if not self.keywords or not self.domains:
             raise ValueError("Please configure keywords and domains first")
         
+        if self.interval_minutes <= 0:
+            raise ValueError("interval_minutes must be positive")
+        
         self.running = True
         self.stop_event.clear()
+        start = time.monotonic()
+        self._cycle_anchor = self._current_cycle(time.time())
         
-        if run_immediately:
-            print("Running initial check...")
-            self.check_all()
+        if not block:
+            if run_immediately:
+                logger.info("Running initial check...")
+                self.check_all(self._tick_cycle(0))
+            
+            # Start background thread
+            self.thread = Thread(target=self._monitor_loop, args=(start,), daemon=True)
+            self.thread.start()
+            logger.info("Monitor started. Will check every %s minutes.", self.interval_minutes)
+            return
         
-        # Start background thread
-        self.thread = Thread(target=self._monitor_loop, daemon=True)
-        self.thread.start()
-        print(f"Monitor started. Will check every {self.interval_minutes} minutes.")
+        try:
+            if run_immediately:
+                logger.info("Running initial check...")
+                self.check_all(self._tick_cycle(0))
+            
+            logger.info("Monitor started. Will check every %s minutes.", self.interval_minutes)
+            self._monitor_loop(start)
+        finally:
+            self.running = False
     
     def stop(self):
         """Stop monitoring"""
         if not self.running:
-            print("Monitor is not running")
+            logger.warning("Monitor is not running")
             return
         
-        print("Stopping monitor...")
+        logger.info("Stopping monitor...")
         self.running = False
         self.stop_event.set()
         
         if self.thread:
             self.thread.join(timeout=5)
         
-        print("Monitor stopped")
+        logger.info("Monitor stopped")
     
     def run_once(self):
         """Run a single monitoring check"""